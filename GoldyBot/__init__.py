@@ -3,6 +3,9 @@
 
 Copyright (C) 2023 - Goldy
 """
+import importlib
+from typing import TYPE_CHECKING
+
 from devgoldyutils import Colours
 
 from .logging import LoggerAdapter, log, goldy_bot_logger, LOGGER_NAME
@@ -10,10 +13,53 @@ from .logging import LoggerAdapter, log, goldy_bot_logger, LOGGER_NAME
 from .info import VERSION, DISPLAY_NAME
 from .paths import Paths
 
-from .goldy import Goldy, get_goldy_instance
-from .goldy.token import Token
-from .goldy.extensions import Extension
-from .goldy.commands.decorator import command
-from .goldy.utils import *
+if TYPE_CHECKING:
+    from .goldy import Goldy, get_goldy_instance
+    from .goldy.token import Token
+    from .goldy.extensions import Extension
+    from .goldy.commands.decorator import command
+    from .goldy.utils import cache_lookup
+
+    from .goldy.objects.gold_platter import GoldPlatter, PlatterType
+
+# Lazy imports.
+# --------------
+# The core pulls in nextcore, motor, cmd2 and more, so these are only imported when first accessed.
+_lazy_imports = {
+    "Goldy": ".goldy",
+    "get_goldy_instance": ".goldy",
+    "Token": ".goldy.token",
+    "Extension": ".goldy.extensions",
+    "command": ".goldy.commands.decorator",
+    "cache_lookup": ".goldy.utils",
+
+    "GoldPlatter": ".goldy.objects.gold_platter",
+    "PlatterType": ".goldy.objects.gold_platter",
+}
+
+__all__ = [
+    "Colours", 
+    "LoggerAdapter", 
+    "log", 
+    "goldy_bot_logger", 
+    "LOGGER_NAME", 
+    "VERSION", 
+    "DISPLAY_NAME", 
+    "Paths", 
+    *_lazy_imports
+]
+"""Star imports go through ``__getattr__`` for the lazy names so ``from GoldyBot import *`` still exports everything."""
+
+def __getattr__(name:str):
+    module_name = _lazy_imports.get(name)
+
+    if module_name is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value # Cache it so __getattr__ isn't hit again.
+
+    return value
 
-from .goldy.objects.gold_platter import GoldPlatter, PlatterType
\ No newline at end of file
+def __dir__():
+    return list(globals()) + list(_lazy_imports)
@@ -1,4 +1,4 @@
-import json
+import orjson
 from devgoldyutils import Colours
 
 from . import goldy_bot_logger, LoggerAdapter
@@ -18,7 +18,7 @@ class Config():
         )
 
         self.logger.debug("Phrasing json in config to dict...")
-        self.json_data:dict = json.loads(self.file.read())
+        self.json_data:dict = orjson.loads(self.file.read())
         self.file.close()
         self.logger.debug(Colours.GREEN.apply_to_string("Done!"))
 
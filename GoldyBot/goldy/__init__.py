@@ -8,8 +8,7 @@ from nextcore.http.client import HTTPClient
 from nextcore.http import BotAuthentication, UnauthorizedError
 from nextcore.gateway import ShardManager
 
-from typing import Dict, Any
-from discord_typings import UpdatePresenceData, PartialActivityData, ApplicationData
+from discord_typings import ApplicationData
 from devgoldyutils import Colours
 
 from .. import LoggerAdapter, goldy_bot_logger
@@ -21,17 +20,28 @@ from .token import Token
 # Fixes this https://github.com/nextsnake/nextcore/issues/189.
 if sys.platform == "win32":
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+else:
+    # Use uvloop for a faster event loop if it's installed. (pip install GoldyBot[speedups])
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
 
-cache:Dict[str, Any] = {
-    "goldy_core_instance": None,
-}
+# Log messages built once as READY fires for every shard and on every reconnect.
+_READY_MSG = f"Nextcore shards are {Colours.GREEN.apply_to_string('connected')} and {Colours.BLUE.apply_to_string('READY!')}"
+_SHUTDOWN_MSG = Colours.YELLOW.apply_to_string("Goldy Bot is shutting down...")
+
+_goldy_core_instance:Goldy | None = None
+"""The instance of the goldy core class. Use ``get_goldy_instance()`` to get it."""
 
 class Goldy():
     """The main Goldy Bot class that controls the whole framework and let's you start an instance of Goldy Bot. Also known as the core."""
     def __init__(self, token:Token = None, raise_on_extension_loader_error = None):
         self.token = token
         self.logger = LoggerAdapter(goldy_bot_logger, Colours.ORANGE.apply_to_string("Goldy"))
-        self.async_loop = asyncio.get_event_loop()
+        self.async_loop:asyncio.AbstractEventLoop | None = None
+        """The event loop goldy bot is running in. This is None until goldy bot is started."""
 
         # Boot title and copyright stuff.
         print(
@@ -44,7 +54,9 @@ class Goldy():
             self.token = Token()
         
         self.nc_authentication = BotAuthentication(self.token.discord_token)
-        self.intents = 1 << 9 | 1 << 15
+        # GUILDS, GUILD_MESSAGES and MESSAGE_CONTENT. GUILD_MEMBERS is left out on purpose 
+        # so discord never sends us member chunks, guilds are streamed in with GUILD_CREATE instead.
+        self.intents = 1 << 0 | 1 << 9 | 1 << 15
 
         self.http_client = HTTPClient()
 
@@ -53,18 +65,18 @@ class Goldy():
             intents = self.intents,
             http_client = self.http_client,
 
-            presence = UpdatePresenceData(
-                activities = [PartialActivityData(name=f"Goldy Bot (v{VERSION})", type=ActivityTypes.PLAYING_GAME.value)],
-                since = None,
-                status = Status.ONLINE.value,
-                afk = False
-            )
+            presence = DEFAULT_PRESENCE.copy()
         )
 
         self.application_data:ApplicationData = None
 
-        # Add to cache.
-        cache["goldy_core_instance"] = self
+        self.ready_event:asyncio.Event | None = None
+        """Event that is set once goldy bot has finished setting up. Commands are not invoked before this is set."""
+        self._setup_task:asyncio.Task | None = None
+
+        # Set as the goldy instance.
+        global _goldy_core_instance
+        _goldy_core_instance = self
 
         # Adding shortcuts to sub classes to core class.
         # --------------------------------
@@ -76,8 +88,12 @@ class Goldy():
         """
         Class that allows you to retrieve configuration data from the ``goldy.json`` config file. 
         
-        All properties return None when not found in the config.
+        Properties return None when not found in the config, except ``ignored_extensions`` which returns an empty set 
+        and ``raise_on_extension_loader_error`` which defaults to True. ``allowed_guilds`` raises if it's missing.
         """
+        self._allowed_guild_ids = self.config.allowed_guild_ids
+        """Set of allowed guild ids used for quick lookups when invoking commands."""
+
         self.command_loader = CommandLoader(self)
         """Class that handles command loading."""
         self.extension_loader = ExtensionLoader(self, raise_on_extension_loader_error)
@@ -91,18 +107,17 @@ class Goldy():
     def start(self):
         """🧡🌆 Awakens Goldy Bot from her hibernation. 😴 Shortcut to ``asyncio.run(goldy.__start_async())`` and also handles various exceptions carefully."""
         try:
-            self.async_loop.run_until_complete(
-                self.__start_async()
-            )
+            asyncio.run(self.__start_async())
         except KeyboardInterrupt:
             self.stop("Keyboard interrupt detected!")
-        except RuntimeError as e:
-            # I really do hope this doesn't torture me in the future. 💀
-            pass
 
         return None
 
     async def __start_async(self):
+        self.async_loop = asyncio.get_running_loop()
+        self.ready_event = asyncio.Event()
+
+        await self.database.connect()
         await self.http_client.setup()
 
         # This should return once all shards have started to connect.
@@ -117,19 +132,22 @@ class Goldy():
 
         # Log when shards are ready.
         self.shard_manager.event_dispatcher.add_listener(
-            lambda x: self.logger.info(f"Nextcore shards are {Colours.GREEN.apply_to_string('connected')} and {Colours.BLUE.apply_to_string('READY!')}"), 
+            lambda x: self.logger.info(_READY_MSG), 
             event_name="READY"
         )
 
         await self.pre_setup()
-        await self.setup()
+
+        # Run setup in the background so shards are not held back by extension and command loading.
+        self._setup_task = self.async_loop.create_task(self.setup())
+        self._setup_task.add_done_callback(self.__on_setup_done)
 
         self.live_console.start()
 
         # Raise a error and exit whenever a critical error occurs.
         error = await self.shard_manager.dispatcher.wait_for(lambda reason: True, "critical")
 
-        self.logger.warn(Colours.YELLOW.apply_to_string("Goldy Bot is shutting down..."))
+        self.logger.warn(_SHUTDOWN_MSG)
         self.logger.info(Colours.BLUE.apply_to_string(f"Reason: {error[0]}"))
 
         await self.__stop_async()
@@ -139,20 +157,43 @@ class Goldy():
         self.application_data = await self.http_client.get_current_bot_application_information(self.nc_authentication)
 
     async def setup(self):
-        """Method ran to set up goldy bot."""
-        await self.guilds.setup()
-        
+        """Method ran to set up goldy bot. Guilds aren't waited on here, they're set up as discord streams them in."""
         self.extension_loader.load()
         await self.command_loader.load()
 
+        self.ready_event.set()
+
+    def __on_setup_done(self, task:asyncio.Task) -> None:
+        """Stops goldy bot if the background setup task failed, like it would if setup was awaited directly."""
+        if task.cancelled():
+            return None
+
+        error = task.exception()
+
+        if error is None:
+            return None
+
+        self.logger.error(f"Goldy Bot failed to set up! ERROR --> {error}")
+        self.stop(f"Setup failed: {error}")
+
     def stop(self, reason:str = "Unknown Reason"):
         """Shuts down goldy bot right away and safely incase anything sussy wussy is going on. 😳"""
         self.live_console.stop()
 
-        self.async_loop.create_task(self.shard_manager.dispatcher.dispatch("critical", reason)) # Raises critical error within nextcore and stops it.
+        if self.async_loop is None or self.async_loop.is_closed():
+            return None
+
+        # This may be called from other threads like the live console so the task is scheduled thread safely.
+        self.async_loop.call_soon_threadsafe(
+            self.async_loop.create_task, self.shard_manager.dispatcher.dispatch("critical", reason) # Raises critical error within nextcore and stops it.
+        )
 
     async def __stop_async(self):
         """This is an internal method and NOT to be used by you. Use the ``Goldy().stop()`` instead. This method is ran when nextcore raises a critical error."""
+        if self._setup_task is not None and not self._setup_task.done():
+            self.logger.debug("Cancelling setup task...")
+            self._setup_task.cancel()
+
         await self.presence.change(Status.INVISIBLE) # Set bot to invisible before shutting off.
         
         self.logger.debug("Closing nextcore http client...")
@@ -163,16 +204,13 @@ class Goldy():
 
         self.logger.debug("Closing AsyncIOMotorClient...")
         self.database.client.close()
-    
-        self.logger.debug("Closing async_loop...")
-        self.async_loop.stop()
 
 
 # Get goldy instance method.
 # ---------------------------
 def get_goldy_instance() -> Goldy | None:
     """Returns instance of goldy core class."""
-    return cache["goldy_core_instance"]
+    return _goldy_core_instance
 
 get_core = get_goldy_instance
 """Returns instance of goldy core class."""
@@ -183,7 +221,7 @@ get_goldy = get_goldy_instance
 # Root imports.
 # -------------
 from .database import Database
-from .presence import Presence, Status, ActivityTypes
+from .presence import Presence, Status, ActivityTypes, DEFAULT_PRESENCE
 from .goldy_config import GoldyConfig
 from .extensions.extension_loader import ExtensionLoader
 from .extensions.extension_reloader import ExtensionReloader
@@ -1,23 +1,42 @@
 from __future__ import annotations
 
-from typing import List, Callable, Tuple, TYPE_CHECKING
+from typing import Dict, List, Callable, Tuple, TYPE_CHECKING
 from discord_typings import ApplicationCommandData, MessageData, InteractionData
 
-from .. import utils
 from ..objects import GoldPlatter, PlatterType
 from ... import LoggerAdapter, goldy_bot_logger
 from ..extensions import Extension, extensions_cache
 
 if TYPE_CHECKING:
+    from discord_typings import ApplicationCommandPayload
     from ... import Goldy
 
-commands_cache:List[Tuple[str, object]] = []
+commands_cache:Dict[str, Command] = {}
 """
 This cache contains all the commands that have been registered and it's memory location to the class.
 """
 
 class Command():
     """Class that represents all commands in goldy bot."""
+    __slots__ = (
+        "func", 
+        "name", 
+        "description", 
+        "required_roles", 
+        "allow_prefix_cmd", 
+        "allow_slash_cmd", 
+        "parent_cmd", 
+        "goldy", 
+        "logger", 
+        "params", 
+        "list_of_application_command_data", 
+        "_extension_name", 
+        "_extension_ref", 
+        "__params_amount", 
+        "__in_extension", 
+        "__loaded"
+    )
+
     def __init__(
         self, 
         goldy:Goldy, 
@@ -45,76 +64,77 @@ class Command():
         self.parent_cmd = parent_cmd
         """Command object of the parent command if this command is a subcommand."""
 
+        # If cmd_name is null, set it to function name.
+        if self.name is None:
+            self.name = self.func.__name__
+
         self.goldy = goldy
         self.logger = LoggerAdapter(
             LoggerAdapter(goldy_bot_logger, prefix="Command"), 
-            prefix=(lambda x: self.func.__name__ if x is None else x)(self.name)
+            prefix=self.name
         )
-
-        # If cmd_name is null, set it to function name.
-        if self.name is None:
-            self.name = self.func.__name__
         
         if self.description is None:
             self.description = "This command has no description. Sorry about that."
         
-        # Get list of function params.
-        self.params = list(self.func.__code__.co_varnames)
-        self.__params_amount = self.func.__code__.co_argcount
+        # Get function params. co_varnames also has the function's local variables so only the first co_argcount names are params.
+        code = self.func.__code__
+        params_amount = code.co_argcount
+        params = code.co_varnames[:params_amount]
         
         # Check if command is inside extension by checking if self is first parameter.
         self.__in_extension = False
 
-        if self.params[0] == "self":
+        if params and params[0] == "self":
             self.__in_extension = True
-            self.__params_amount -= 1
-            self.params.pop(0)
+            params_amount -= 1
+            params = params[1:]
+
+        self.params:Tuple[str, ...] = params
+        self.__params_amount = params_amount
+
+        self._extension_name:str | None = self.func.__qualname__.split(".", 1)[0] if self.__in_extension else None
+        self._extension_ref:Extension | None = None
 
         self.list_of_application_command_data:List[Tuple[str, ApplicationCommandData]] | None = None
 
         self.__loaded = False
 
-        # Callbacks
-        # ----------
-        self.__slash_callback = lambda x: self.goldy.async_loop.create_task(self.__invoke(x, type=PlatterType.SLASH_CMD))
-        self.__normal_callback = lambda x: self.goldy.async_loop.create_task(self.__invoke(x, type=PlatterType.PREFIX_CMD))
+        existing_command = commands_cache.get(self.name)
 
-        commands_cache.append(
-            (self.name, self)
-        )
+        if existing_command is not None and existing_command is not self:
+            extension_info = "" if existing_command.extension_name is None else f" (extension: {existing_command.extension_name})"
+
+            self.logger.warning(
+                f"A command named '{self.name}' already exists{extension_info}! The existing command is being replaced and can no longer be invoked."
+            )
+
+        commands_cache[self.name] = self
 
         self.logger.debug("Command initialized!")
 
     @property
     def in_extension(self) -> bool:
         """Returns true if the command is in an extension."""
-        if self.__in_extension:
-            return True
-        return False
+        return self.__in_extension
 
     @property
     def extension_name(self) -> str | None:
         """Returns extension's code name."""
-        if self.in_extension:
-            return str(self.func).split(" ")[1].split(".")[0]
-
-        return None
+        return self._extension_name
 
     @property
     def extension(self) -> Extension | None:
         """Finds and returns the object of the command's extension. Returns None if command is not in any extension."""
-        if self.in_extension:
-            return utils.cache_lookup(self.extension_name, extensions_cache)[1]
-        
-        return None
+        if self._extension_ref is None and self.__in_extension:
+            self._extension_ref = extensions_cache.get(self._extension_name)
+
+        return self._extension_ref
 
     @property
     def is_child(self):
         """Returns if command is child or not. Basically is it a subcommand or not essentially."""
-        if self.parent_cmd is None:
-            return False
-        else:
-            return True
+        return self.parent_cmd is not None
     
     @property
     def loaded(self) -> bool:
@@ -122,13 +142,16 @@ class Command():
         return self.__loaded
 
 
-    async def __invoke(self, data:MessageData|InteractionData, type:PlatterType|int) -> bool:
-        """Runs/triggers this command. This method is mostly supposed to be used internally."""
+    async def invoke(self, data:MessageData|InteractionData, type:PlatterType|int) -> bool:
+        """Runs/triggers this command. This method is mostly supposed to be used internally and is called by the command loader's listeners."""
+        # Don't invoke until goldy bot has finished setting up.
+        if not self.goldy.ready_event.is_set():
+            return False
+
         # If not from guild in allowed guilds don't invoke.
-        if data["guild_id"] in [x[0] for x in self.goldy.config.allowed_guilds]:
+        if data["guild_id"] in self.goldy._allowed_guild_ids:
         
             gold_plater = GoldPlatter(data, type, goldy=self.goldy, command=self)
-            guild = self.goldy.guilds.get_guild(data["guild_id"])
 
             # TODO: Add all permission and argument management stuff here...
 
@@ -137,128 +160,76 @@ class Command():
             # ------------------------
             if gold_plater.type.value == PlatterType.PREFIX_CMD.value:
                 data:MessageData = data
-                prefix = guild.prefix
 
-                if data["content"] == f"{prefix}{self.name}":
-                    self.logger.info(f"Prefix command invoked by '{data['author']['username']}#{data['author']['discriminator']}'.")
+                self.logger.info(f"Prefix command invoked by '{data['author']['username']}#{data['author']['discriminator']}'.")
 
-                    if self.in_extension:
-                        await self.func(self.extension, gold_plater)
-                    else:
-                        await self.func(gold_plater)
+                if self.__in_extension:
+                    await self.func(self._extension_ref, gold_plater)
+                else:
+                    await self.func(gold_plater)
 
 
             # Slash command.
             # ----------------
             if gold_plater.type.value == PlatterType.SLASH_CMD.value:
                 data:InteractionData = data
-                prefix = guild.prefix
 
                 self.logger.info(f"Slash command invoked by '{data['member']['user']['username']}#{data['member']['user']['discriminator']}'.")
 
-                if self.in_extension:
-                    await self.func(self.extension, gold_plater)
+                if self.__in_extension:
+                    await self.func(self._extension_ref, gold_plater)
                 else:
                     await self.func(gold_plater)
 
 
-    async def create_slash(self) -> List[ApplicationCommandData]:
-        """Creates and registers a slash command in goldy bot. E.g.``/goldy``"""
-        self.logger.info(f"Creating slash command for '{self.name}'...")
-
-        list_of_application_command_data = []
-
-        # Add slash command for each allowed guild.
-        # -------------------------------------------
-        for guild in self.goldy.guilds.allowed_guilds:
-
-            list_of_application_command_data.append(
-                (
-                    guild[0], 
-                    await self.goldy.http_client.create_guild_application_command(
-                        authentication = self.goldy.nc_authentication,
-                        application_id = self.goldy.application_data["id"],
-                        guild_id = guild[0],
-
-                        name = self.name,
-                        description = self.description,
-                    )
-                )
-            )
-
-            self.logger.debug(f"Created slash for guild '{guild[1]}'.")
+    @property
+    def slash_payload(self) -> ApplicationCommandPayload:
+        """The payload discord needs to create this slash command. The command loader bulk registers these for each guild."""
+        return {
+            "name": self.name,
+            "description": self.description,
+        }
 
-        # Set event listener for slash command.
-        # --------------------------------------
-        self.goldy.shard_manager.event_dispatcher.add_listener(
-            self.__slash_callback,
-            event_name="INTERACTION_CREATE"
-        )
 
-        self.list_of_application_command_data = list_of_application_command_data
-        return list_of_application_command_data
-    
+    def remove_slash(self) -> None:
+        """
+        Un-registers the slash command.
 
-    async def remove_slash(self) -> None:
-        """Un-registers the slash command."""
+        The command is removed from discord the next time the command loader bulk registers slash commands, like after an extension reload.
+        """
         self.logger.debug(f"Removing slash command for '{self.name}'...")
 
-        for slash_command in self.list_of_application_command_data:
-            
-            await self.goldy.http_client.delete_guild_application_command(
-                authentication = self.goldy.nc_authentication,
-                application_id = self.goldy.application_data["id"],
-                guild_id = slash_command[0],
-                command_id = slash_command[1]["id"],
-            )
-
-            self.logger.debug(f"Deleted slash for guild with id '{slash_command[0]}'.")
-
-        # Remove event listener for slash command.
-        # --------------------------------------
-        self.goldy.shard_manager.event_dispatcher.remove_listener(
-            self.__slash_callback,
-            event_name="INTERACTION_CREATE"
-        )
+        self.list_of_application_command_data = None
 
         return None
     
 
     def create_normal(self) -> None:
-        """Creates and registers a normal on-msg/prefix command in goldy bot. Also know as a prefix command. E.g.``!goldy``"""
+        """
+        Creates and registers a normal on-msg/prefix command in goldy bot. Also know as a prefix command. E.g.``!goldy``
+        
+        Prefix commands are routed by the command loader's ``MESSAGE_CREATE`` listener once loaded so there's nothing to register with nextcore.
+        """
         self.logger.info(f"Creating normal/prefix command for '{self.name}'...")
-
-        self.goldy.shard_manager.event_dispatcher.add_listener(
-            self.__normal_callback,
-            event_name="MESSAGE_CREATE"
-        )
-
         return None
     
 
     def remove_normal(self) -> None:
         """Un-registers the prefix command."""
         self.logger.debug(f"Removing normal/prefix command for '{self.name}'...")
-
-        self.goldy.shard_manager.event_dispatcher.remove_listener(
-            self.__normal_callback,
-            event_name="MESSAGE_CREATE"
-        )
-
         return None
 
 
     async def load(self) -> None:
-        """Loads and creates the command."""
-
-        if self.allow_slash_cmd:
-            await self.create_slash()
+        """Loads and creates the command. Slash commands are registered with discord afterwards by ``CommandLoader.register_all_slash()``."""
 
         if self.allow_prefix_cmd:
             self.create_normal()
 
-        if self.extension is not None:
-            self.extension.add_command(self)
+        extension = self.extension
+
+        if extension is not None:
+            extension.add_command(self)
 
         self.__loaded = True
 
@@ -269,7 +240,7 @@ class Command():
         """Unloads and removes the command."""
 
         if self.allow_slash_cmd:
-            await self.remove_slash()
+            self.remove_slash()
 
         if self.allow_prefix_cmd:
             self.remove_normal()
@@ -282,7 +253,8 @@ class Command():
         """Completely deletes this command. Unloads it and removes it from cache."""
         await self.unload()
 
-        commands_cache.remove((self.name, self))
+        if commands_cache.get(self.name) is self:
+            del commands_cache[self.name]
 
         self.logger.info(f"Command '{self.name}' deleted!")
     
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from typing import List, overload, TYPE_CHECKING
+import asyncio
+from typing import Dict, List, overload, TYPE_CHECKING
+from discord_typings import MessageData, InteractionData
 
 from .. import Goldy
 from ... import goldy_bot_logger, LoggerAdapter
+from ..objects import PlatterType
 from . import commands_cache
 
 if TYPE_CHECKING:
+    from discord_typings import ApplicationCommandPayload
     from . import Command
 
 class CommandLoader():
@@ -16,6 +20,57 @@ class CommandLoader():
 
         self.logger = LoggerAdapter(goldy_bot_logger, prefix="CommandLoader")
 
+        # One listener for each event that dispatches to the right command, rather than one listener per command.
+        # ---------------------------------------------------------------------------------------------------------
+        self.goldy.shard_manager.event_dispatcher.add_listener(self._on_message, event_name="MESSAGE_CREATE")
+        self.goldy.shard_manager.event_dispatcher.add_listener(self._on_interaction, event_name="INTERACTION_CREATE")
+
+    def _on_message(self, data:MessageData) -> None:
+        """Finds the prefix command a message is invoking, if any, and runs it. Most messages aren't commands so this bails out as early and cheaply as it can."""
+        content = data["content"]
+
+        if content == "": # E.g. attachment only messages.
+            return None
+
+        guild = self.goldy.guilds.get_guild(data.get("guild_id"))
+
+        if guild is None:
+            return None
+
+        prefix = guild.prefix
+
+        if not content.startswith(prefix):
+            return None
+
+        # Only split off the first word, that's the command name.
+        tokens = content[len(prefix):].split(None, 1)
+
+        if tokens == []:
+            return None
+
+        command = commands_cache.get(tokens[0])
+
+        if command is not None and command.loaded and command.allow_prefix_cmd:
+            self.goldy.async_loop.create_task(command.invoke(data, type=PlatterType.PREFIX_CMD))
+
+        return None
+
+    def _on_interaction(self, data:InteractionData) -> None:
+        """Finds the slash command an interaction is invoking and runs it."""
+        if not data["type"] == 2: # Only application command interactions.
+            return None
+
+        # Like prefix commands, ignore guilds that haven't been set up (yet).
+        if self.goldy.guilds.get_guild(data.get("guild_id")) is None:
+            return None
+
+        command = commands_cache.get(data["data"]["name"])
+
+        if command is not None and command.loaded and command.allow_slash_cmd:
+            self.goldy.async_loop.create_task(command.invoke(data, type=PlatterType.SLASH_CMD))
+
+        return None
+
     @overload
     async def load(self) -> None:
         """Loads all commands that have been initialized in goldy bot."""
@@ -29,10 +84,87 @@ class CommandLoader():
     async def load(self, commands:List[Command] = None) -> None:
         """Loads all commands that have been initialized in goldy bot."""
         if commands is None:
-            commands = [x[1] for x in commands_cache]
+            commands = list(commands_cache.values())
 
         for command in commands:
             if command.loaded is False:
                 await command.load()
+
+        await self.register_all_slash()
         
+        return None
+
+    async def register_all_slash(self) -> None:
+        """
+        Registers every loaded slash command with discord. Each allowed guild gets one bulk overwrite request, all sent concurrently.
+
+        Bulk overwriting replaces the guild's whole command set so slash commands that have been unloaded are removed from discord too.
+        """
+        commands:Dict[str, Command] = {}
+        payloads = []
+
+        for command in commands_cache.values():
+            if not (command.loaded and command.allow_slash_cmd):
+                continue
+
+            payload = command.slash_payload
+            error = self.__check_slash_payload(payload)
+
+            # One invalid command would make discord reject the guild's whole bulk overwrite so it's skipped instead.
+            if error is not None:
+                self.logger.error(f"Not registering the slash command '{command.name}' as {error}")
+                continue
+
+            commands[command.name] = command
+            payloads.append(payload)
+
+        allowed_guilds = self.goldy.guilds.allowed_guilds
+
+        self.logger.info(f"Registering {len(payloads)} slash command(s) in {len(allowed_guilds)} guild(s)...")
+
+        results = await asyncio.gather(
+            *[
+                self.goldy.http_client.bulk_overwrite_guild_application_commands(
+                    authentication = self.goldy.nc_authentication,
+                    application_id = self.goldy.application_data["id"],
+                    guild_id = guild[0],
+                    commands = payloads
+                ) for guild in allowed_guilds
+            ],
+            return_exceptions = True
+        )
+
+        for command in commands.values():
+            command.list_of_application_command_data = []
+
+        for guild, result in zip(allowed_guilds, results):
+
+            if isinstance(result, Exception):
+                self.logger.error(f"Failed to register slash commands for guild '{guild[1]}'! ERROR --> {result}")
+                continue
+
+            for application_command_data in result:
+                command = commands.get(application_command_data["name"])
+
+                if command is not None:
+                    command.list_of_application_command_data.append((guild[0], application_command_data))
+
+            self.logger.debug(f"Registered slash commands for guild '{guild[1]}'.")
+
+        return None
+
+    def __check_slash_payload(self, payload:ApplicationCommandPayload) -> str | None:
+        """Returns why discord would reject this slash command payload or None if it looks valid."""
+        name = payload["name"]
+        description = payload["description"]
+
+        if not 1 <= len(name) <= 32:
+            return f"its name has to be 1-32 characters long. (it's {len(name)})"
+
+        if not name == name.lower() or any(char.isspace() for char in name):
+            return "its name has to be lowercase with no spaces."
+
+        if not 1 <= len(description) <= 100:
+            return f"its description has to be 1-100 characters long. (it's {len(description)})"
+
         return None
\ No newline at end of file
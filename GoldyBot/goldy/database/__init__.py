@@ -1,15 +1,14 @@
 from __future__ import annotations
-import asyncio
-from typing import List
+from typing import List, TYPE_CHECKING
 
 from enum import Enum
 
-import pymongo
-from pymongo.errors import ServerSelectionTimeoutError
 from devgoldyutils import Colours
-import motor.motor_asyncio
 from .. import Goldy, LoggerAdapter, goldy_bot_logger, GoldyBotError
 
+if TYPE_CHECKING:
+    import pymongo
+
 from .databases import GoldyDB
 
 class DatabaseEnums(Enum):
@@ -25,13 +24,25 @@ class Database():
     def __init__(self, goldy:Goldy):
         self.goldy = goldy
         self.database_token_url = self.goldy.token.database_token
-        self.async_loop = asyncio.get_event_loop()
         self.logger = LoggerAdapter(goldy_bot_logger, prefix="Database")
 
+        # Motor is heavy to import so it's only imported once the database is actually initialized.
+        import motor.motor_asyncio
+
         # Initializing MongoDB database.
         try:
             self.client:pymongo.MongoClient = motor.motor_asyncio.AsyncIOMotorClient(self.database_token_url, serverSelectionTimeoutMS=2000)
-            self.async_loop.run_until_complete(self.client.server_info())
+        except Exception as e:
+            raise GoldyBotError(
+                f"Couldn't connect to Database! Error received from motor >>> {e}"
+            )
+
+    async def connect(self) -> None:
+        """Checks goldy bot can reach the database. This is ran when goldy bot starts as it needs the event loop to be running."""
+        from pymongo.errors import ServerSelectionTimeoutError
+
+        try:
+            await self.client.server_info()
             self.logger.info("AsyncIOMotorClient " + Colours.GREEN.apply_to_string("Connected!"))
         except ServerSelectionTimeoutError as e:
             raise GoldyBotError(
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 from abc import ABC, abstractmethod
-from typing import Tuple, List, TYPE_CHECKING
+from typing import Dict, List, TYPE_CHECKING
 
 from ...goldy import get_goldy_instance
 from ... import goldy_bot_logger, LoggerAdapter
@@ -10,7 +10,7 @@ from ... import goldy_bot_logger, LoggerAdapter
 if TYPE_CHECKING:
     from ..commands import Command
 
-extensions_cache:List[Tuple[str, object]] = []
+extensions_cache:Dict[str, Extension] = {}
 """
 This cache contains all the extensions that have been loaded and it's memory location to the class.
 """
@@ -61,9 +61,7 @@ class Extension(ABC):
         # ---------------------------------------
         if not self.code_name in self.ignored_extensions_list:
             self.logger.debug("Adding myself to cache...")
-            extensions_cache.append(
-                (self.code_name, self)
-            )
+            extensions_cache[self.code_name] = self
         
             self.logger.debug("Loading commands...")
             self.loader() # Load commands.
@@ -97,7 +95,8 @@ class Extension(ABC):
         for command in self.get_commands():
             await command.delete()
 
-        extensions_cache.remove((self.code_name, self))
+        if extensions_cache.get(self.code_name) is self:
+            del extensions_cache[self.code_name]
 
         self.logger.debug(f"Extension '{self.code_name}' removed!")
 
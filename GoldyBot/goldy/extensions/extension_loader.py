@@ -18,7 +18,8 @@ class ExtensionLoader():
         if self.raise_on_load_error is None:
             self.raise_on_load_error = self.goldy.config.raise_on_extension_loader_error
 
-        self.path_to_extensions_folder:str|None = (lambda x: os.path.abspath(x) if isinstance(x, str) else x)(goldy.config.extension_folder_location)
+        extension_folder_location = goldy.config.extension_folder_location
+        self.path_to_extensions_folder:str|None = os.path.abspath(extension_folder_location) if isinstance(extension_folder_location, str) else extension_folder_location
         self.ignored_extensions = goldy.config.ignored_extensions
 
         self.logger = LoggerAdapter(goldy_bot_logger, prefix="ExtensionLoader")
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 import pathlib
-from typing import List, overload, TYPE_CHECKING
+from typing import Dict, List, overload, TYPE_CHECKING
 import importlib.util
 
 from .. import Goldy, GoldyBotError
@@ -32,9 +32,9 @@ class ExtensionReloader():
     async def reload(self, extensions:List[Extension] = None) -> None:
         """Reloads each extension in this list. If extensions is kept none, goldy bot will reload all the extensions loaded itself."""
         if extensions is None:
-            extensions = [x[1] for x in extensions_cache]
+            extensions = list(extensions_cache.values())
 
-        loaded_paths = []
+        loaded_paths:Dict[str, None] = {} # Used as an ordered set.
 
         self.logger.info(f"Reloading these extensions --> {[x.code_name for x in extensions]}")
 
@@ -42,10 +42,9 @@ class ExtensionReloader():
             # Delete all commands in extension.
             await extension.delete()
 
-            if not extension.loaded_path in loaded_paths:
-                loaded_paths.append(extension.loaded_path)
+            loaded_paths[extension.loaded_path] = None
 
-        self.goldy.extension_loader.load(loaded_paths)
+        self.goldy.extension_loader.load(list(loaded_paths))
 
         # Load commands again.
         await self.goldy.command_loader.load()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Tuple
+from typing import List, Tuple, FrozenSet
 
 from ..config import Config
 from ..errors import GoldyBotError
@@ -9,7 +9,8 @@ class GoldyConfig(Config):
     """
     Class that allows you to retrieve configuration data from the ``goldy.json`` config file.
 
-    All properties return None when not found in the config.
+    Properties return None when not found in the config, except ``ignored_extensions`` which returns an empty set 
+    and ``raise_on_extension_loader_error`` which defaults to True. ``allowed_guilds`` raises if it's missing.
     """
     def __init__(self):
         try:
@@ -19,24 +20,40 @@ class GoldyConfig(Config):
                 f"Goldy config not found in root! Please generate one by creating an environment with the command 'goldybot setup' in terminal. \nERROR -> {e}"
             )
 
+        # Values are read from the json once here so properties don't walk the json dict on every access.
+        # ---------------------------------------------------------------------------------------------------
+        self.__ignored_extensions:FrozenSet[str] = frozenset(self.get("goldy", "extensions", "ignored_extensions") or ())
+        self.__extension_folder_location:str = self.get("goldy", "extensions", "folder_location")
+        self.__raise_on_extension_loader_error:bool = self.get("goldy", "extensions", "raise_on_load_error", default_value=True)
+        self.__allowed_guilds:List[Tuple[str, str]] = self.__get_allowed_guilds()
+        self.__allowed_guild_ids:FrozenSet[str] = frozenset(guild[0] for guild in self.__allowed_guilds)
+
     @property
-    def ignored_extensions(self) -> List[str]:
+    def ignored_extensions(self) -> FrozenSet[str]:
         """Returns code name of all ignored extensions from ``goldy.json``."""
-        return self.get("goldy", "extensions", "ignored_extensions")
+        return self.__ignored_extensions
 
     @property
     def extension_folder_location(self) -> str:
         """Returns location set for the extension folder in ``goldy.json``."""
-        return self.get("goldy", "extensions", "folder_location")
+        return self.__extension_folder_location
 
     @property
     def raise_on_extension_loader_error(self) -> bool:
         """Returns whether the extension loader should raise on load errors stopping the entire framework or not."""
-        return self.get("goldy", "extensions", "raise_on_load_error", default_value=True)
+        return self.__raise_on_extension_loader_error
 
     @property
     def allowed_guilds(self) -> List[Tuple[str, str]]:
         """Returns list of tuples including ``guild id`` and ``guild code name`` that are allowed to operate in goldy bot."""
+        return self.__allowed_guilds
+
+    @property
+    def allowed_guild_ids(self) -> FrozenSet[str]:
+        """Returns set of the ``guild id`` of each guild that is allowed to operate in goldy bot."""
+        return self.__allowed_guild_ids
+
+    def __get_allowed_guilds(self) -> List[Tuple[str, str]]:
         tuple_list = []
         data = self.get("goldy", "allowed_guilds")
 
@@ -53,4 +70,4 @@ class GoldyConfig(Config):
         for key in data:
             tuple_list.append((key, data[key]))
 
-        return tuple_list
\ No newline at end of file
+        return tuple_list
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-from typing import List, Tuple
+import asyncio
+from functools import partial
+from typing import Dict, Set, TYPE_CHECKING
 
-from .. import Goldy, utils
+from .. import Goldy
+from ... import LoggerAdapter, goldy_bot_logger
 from ..database import DatabaseEnums
 from ...errors import GoldyBotError
 
 from .guild import Guild
 
+if TYPE_CHECKING:
+    from discord_typings import GuildCreateData
+
 # TODO: Finish this and import it in goldy/__init__.py.
 
 class Guilds():
@@ -15,71 +21,106 @@ class Guilds():
         self.goldy = goldy
         self.allowed_guilds = goldy.config.allowed_guilds
 
+        self.logger = LoggerAdapter(goldy_bot_logger, prefix="Guilds")
+
         if self.allowed_guilds == []:
             raise AllowedGuildsNotSpecified()
         
-        self.guilds:List[Tuple[str|int, Guild]] = []
+        self.guilds:Dict[str|int, Guild] = {}
+        """
+        Goldy bot guilds keyed by their guild id. Guilds are added as discord sends their ``GUILD_CREATE`` event 
+        so a guild that hasn't been streamed in yet won't be here and both prefix and slash commands from it are ignored until it is.
+        """
+
+        self.__allowed_guild_names:Dict[str, str] = dict(self.allowed_guilds)
+        self.__guilds_setting_up:Set[str] = set()
+        """Ids of guilds that are currently being set up so a repeated ``GUILD_CREATE`` doesn't set them up twice."""
+
+        self.goldy.shard_manager.event_dispatcher.add_listener(self._on_guild_create, event_name="GUILD_CREATE")
+
+    def _on_guild_create(self, data:GuildCreateData) -> None:
+        """Sets up each allowed guild as discord streams it to us instead of waiting on every guild before starting."""
+        guild_id = data["id"]
+
+        if guild_id in self.guilds or guild_id in self.__guilds_setting_up or guild_id not in self.__allowed_guild_names:
+            return None
 
-    async def setup(self):
-        """Adds guilds specified in goldy.json to the database if not already added."""
+        self.__guilds_setting_up.add(guild_id)
+
+        task = self.goldy.async_loop.create_task(
+            self.setup_guild(guild_id, self.__allowed_guild_names[guild_id])
+        )
+        task.add_done_callback(partial(self.__on_guild_setup_done, guild_id))
+
+        return None
+
+    def __on_guild_setup_done(self, guild_id:str, task:asyncio.Task) -> None:
+        """Logs any error from setting up a guild, otherwise it would be lost in the task."""
+        self.__guilds_setting_up.discard(guild_id)
+
+        if task.cancelled():
+            return None
+
+        error = task.exception()
+
+        if error is not None:
+            self.logger.error(
+                f"Failed to set up the guild '{self.__allowed_guild_names[guild_id]}' ({guild_id})! Commands from it will be ignored. ERROR --> {error}"
+            )
+
+        return None
+
+    async def setup_guild(self, guild_id:str, code_name:str) -> Guild:
+        """Adds this guild to the database if not already added and caches it."""
         # TODO: Find better way to organize this code, it's too long and complex for my liking.
 
         database = self.goldy.database.get_goldy_database(DatabaseEnums.GOLDY_MAIN)
 
-        for guild in self.allowed_guilds:
+        # Add guild to database.
+        # --------------------------------
+        guild_config_template = {
+            "_id": guild_id,
+            "code_name": code_name,
 
-            # Add guild to database.
-            # --------------------------------
-            guild_config_template = {
-                "_id": guild[0],
-                "code_name": guild[1],
+            "prefix": "!",
 
-                "prefix": "!",
+            "roles": {
 
-                "roles": {
+            },
+            "channels": {
 
-                },
-                "channels": {
+            },
 
-                },
+            "allowed_extensions": [],
+            "disallowed_extensions": [],
+            "hidden_extensions": [],
+        }
 
-                "allowed_extensions": [],
-                "disallowed_extensions": [],
-                "hidden_extensions": [],
-            }
+        guild_config = await database.find_one("guild_configs", query={"_id":guild_id})
 
-            guild_config = await database.find_one("guild_configs", query={"_id":guild[0]})
+        if guild_config is None:
+            guild_config = guild_config_template
+            await database.insert("guild_configs", data=guild_config)
+        else:
+            for item in guild_config_template:
 
-            if guild_config is None:
-                guild_config = guild_config_template
-                await database.insert("guild_configs", data=guild_config)
-            else:
-                for item in guild_config_template:
+                if not item in guild_config:
+                    guild_config[item] = guild_config_template[item]
 
-                    if not item in guild_config:
-                        guild_config[item] = guild_config_template[item]
+            await database.edit("guild_configs", query={"_id":guild_id}, data=guild_config)
 
-                await database.edit("guild_configs", query={"_id":guild[0]}, data=guild_config)
-        
 
-            # Add guild to list.
-            # --------------------
-            self.guilds.append(
-                (guild[0], Guild(id=guild[0], code_name=guild[1], config_dict=guild_config))
-            )
+        # Add guild to cache.
+        # ---------------------
+        guild = Guild(id=guild_id, code_name=code_name, config_dict=guild_config)
+        self.guilds[guild_id] = guild
+
+        return guild
 
 
     def get_guild(self, guild_id:str|int) -> Guild | None:
         """Finds and returns goldy bot guild by id."""
-        cache_tuple = utils.cache_lookup(
-            key=guild_id,
-            cache=self.guilds
-        )
-
-        if cache_tuple is None:
-            return None
-
-        return cache_tuple[1]
+        return self.guilds.get(guild_id)
             
 
 # Exceptions
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+import sys
 import cmd2
-import time
 import threading
 import _thread
 from typing import TYPE_CHECKING
@@ -18,19 +18,41 @@ class LiveConsole(threading.Thread):
         self.goldy = goldy
         self.logger = LoggerAdapter(goldy_bot_logger, prefix=Colours.PURPLE.apply_to_string("Live_Console"))
 
+        self._enabled = sys.stdin.isatty()
+        """The live console only runs when stdin is a terminal. E.g. it's disabled in most containers."""
+
         self.__stop = False
         super().__init__(daemon=True)
 
-    def run(self) -> None:
-        time.sleep(1)
+    @property
+    def stopped(self) -> bool:
+        """Returns whether the live console has been told to stop."""
+        return self.__stop
+
+    def start(self) -> None:
+        if not self._enabled:
+            self.logger.debug("Not starting the live console as stdin is not a terminal.")
+            return None
+
+        super().start()
 
+    def run(self) -> None:
         app = LiveConsoleApp(self.goldy, self.logger)
 
         app.preloop()
 
+        # cmd2's cmdloop() refuses to run outside the main thread so lines are read and ran one at a time here.
         while self.__stop is False:
-            print("")
-            app.onecmd(input("> "))
+            try:
+                line = input(app.prompt)
+            except (EOFError, KeyboardInterrupt):
+                self.logger.debug("Input closed, stopping the live console.")
+                break
+
+            if app.onecmd_plus_hooks(line):
+                break
+
+        self.__stop = True
 
     def stop(self):
         self.__stop = True
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 import cmd2
-from typing import TYPE_CHECKING, Tuple
+from typing import TYPE_CHECKING
 
-from .. import utils
 from ... import log
 from ..extensions import extensions_cache, Extension
 
@@ -16,21 +15,31 @@ class LiveConsoleApp(cmd2.Cmd):
         self.logger = logger
         super().__init__()
 
+        self.prompt = "> "
+
+    def postcmd(self, stop: bool, statement: cmd2.Statement | str) -> bool:
+        return stop or self.goldy.live_console.stopped
+
     def do_reload(self, extension_name: cmd2.Statement):
         extension = None
         if not extension_name == "":
-            extension:Tuple[str, Extension] | None = utils.cache_lookup(extension_name, extensions_cache)
+            extension:Extension | None = extensions_cache.get(extension_name)
 
             if extension is None:
                 self.logger.error(f"The extension '{extension_name}' was not found.")
                 return False
         
+        extensions = [extension] if extension is not None else None
+
         self.logger.info(f"Reloading extension(s)...")
-        self.goldy.async_loop.create_task(self.goldy.extension_reloader.reload((lambda x: x[1] if x is not None else None)(extension)))
+        self.goldy.async_loop.call_soon_threadsafe(
+            self.goldy.async_loop.create_task, self.goldy.extension_reloader.reload(extensions)
+        )
 
     def do_quit(self, _: cmd2.Statement):
         self.logger.debug("Exiting...")
         self.goldy.stop("Console master commanded me to stop!")
+        return True
 
     def do_exit(self, _: cmd2.Statement):
         self.onecmd("quit")
@@ -44,7 +44,7 @@ async def send_msg(platter:objects.GoldPlatter, text:str, reply=False) -> object
             authentication = goldy.nc_authentication,
             channel_id = platter.data['channel_id'],
             content = text,
-            message_reference = (lambda x: x if not None else None)(message_reference_data)
+            message_reference = message_reference_data
         )
 
         platter.command.logger.debug(f"The message '{text[:50]}...' was sent.")
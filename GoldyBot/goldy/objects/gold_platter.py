@@ -23,6 +23,8 @@ class GoldPlatter():
 
     ✨ Behold the gold platter. ✨😁
     """
+    __slots__ = ("data", "goldy", "command", "type")
+
     def __init__(self, data:MessageData|InteractionData, type:PlatterType|int, goldy:Goldy, command:Command) -> None:
         self.data = data
         """The raw data received right from discord that triggered this prefix or slash command."""
@@ -31,7 +33,7 @@ class GoldPlatter():
         self.command = command
         """The object for this command. 😱"""
 
-        self.type:PlatterType = (lambda x: PlatterType(x) if isinstance(x, int) else x)(type)
+        self.type:PlatterType = PlatterType(type) if isinstance(type, int) else type
         """The type of command this is."""
 
     async def send_message(self, text:str, reply:bool=False) -> Message:
@@ -3,11 +3,12 @@ from __future__ import annotations
 from enum import Enum
 from dataclasses import dataclass, field
 from devgoldyutils import Colours
-from discord_typings import PartialActivityData
+from discord_typings import PartialActivityData, UpdatePresenceData
 
 from . import Goldy
 from ..errors import InvalidTypeInMethod
 from .. import LoggerAdapter, goldy_bot_logger
+from ..info import DISPLAY_NAME
 
 class Status(Enum):
     """Goldy Bot enum class of discord status."""
@@ -30,6 +31,14 @@ class ActivityTypes(Enum):
     LISTENING_TO = 2
     WATCHING = 3
 
+DEFAULT_PRESENCE = UpdatePresenceData(
+    activities = [PartialActivityData(name=DISPLAY_NAME, type=ActivityTypes.PLAYING_GAME.value)],
+    since = None,
+    status = Status.ONLINE.value,
+    afk = False
+)
+"""The presence goldy bot starts with. Copy it before handing it to the shard manager as ``Presence.change`` edits ``shard_manager.presence`` in place."""
+
 @dataclass
 class Activity:
     """Goldy bot discord activity."""
@@ -71,7 +80,7 @@ class Presence():
             presence["activities"] = [
                 PartialActivityData(
                     name=activity.name, 
-                    type=(lambda x: x.value if isinstance(x, ActivityTypes) else x)(activity.type), 
+                    type=activity.type.value if isinstance(activity.type, ActivityTypes) else activity.type, 
                     url=activity.url
                 )
             ]
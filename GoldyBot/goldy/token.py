@@ -32,8 +32,11 @@ class Token:
 
         discord_token, mongodb_token = self.get_token_from_env()
 
-        self.discord_token = (lambda entered_token: discord_token if entered_token is None else entered_token)(self.discord_token)
-        self.database_token = (lambda entered_token: mongodb_token if entered_token is None else entered_token)(self.database_token)
+        if self.discord_token is None:
+            self.discord_token = discord_token
+
+        if self.database_token is None:
+            self.database_token = mongodb_token
 
         if self.discord_token is None:
             self.create_token_env_file()
@@ -21,10 +21,7 @@ def cache_lookup(key:str|int, cache:dict|list) -> Tuple[str, ...] | Any | None:
 
 
     if isinstance(cache, dict):
-
-        for obj in cache:
-            if key == obj:
-                return cache[obj]
+        return cache.get(key)
 
     return None
 
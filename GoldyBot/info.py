@@ -1,7 +1,7 @@
 # Version info
 # --------------
-VER = 5.0
-"""Just the version number as an integer. E.g ``5.0``."""
+VER = "5.0"
+"""Just the version number as a string. E.g ``5.0``. Kept as a string so versions like ``5.10`` don't get formatted as ``5.1``."""
 STAGE = ("dev", 1)
 
 VERSION = f"{VER}{STAGE[0]}{STAGE[1]}"
@@ -1,4 +1,7 @@
 import sys; sys.path.insert(0, '..')
 
 from GoldyBot.goldy.utils import cache_lookup
-from GoldyBot.config import Config
\ No newline at end of file
+from GoldyBot.config import Config
+from GoldyBot.goldy.commands import commands_cache
+from GoldyBot.goldy.commands.command_loader import CommandLoader
+from GoldyBot.goldy.objects import PlatterType
\ No newline at end of file
@@ -0,0 +1,143 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+
+from ... import CommandLoader, commands_cache, PlatterType
+
+class StubGoldy():
+    """Just enough of goldy for the command loader's listeners."""
+    def __init__(self):
+        self.listeners = {}
+        self.tasks = []
+
+        self.shard_manager = SimpleNamespace(
+            event_dispatcher = SimpleNamespace(
+                add_listener = lambda callback, event_name: self.listeners.update({event_name: callback})
+            )
+        )
+        self.async_loop = SimpleNamespace(create_task = self.tasks.append)
+        self.guilds = SimpleNamespace(
+            get_guild = lambda guild_id: SimpleNamespace(prefix="!") if guild_id == "123" else None
+        )
+
+def stub_command(loaded = True, allow_prefix_cmd = True, allow_slash_cmd = True):
+    return SimpleNamespace(
+        loaded = loaded, 
+        allow_prefix_cmd = allow_prefix_cmd, 
+        allow_slash_cmd = allow_slash_cmd, 
+        invoke = lambda data, type: (data, type) # Returned as the "coroutine" so we can see what was scheduled.
+    )
+
+@pytest.fixture
+def goldy():
+    goldy = StubGoldy()
+    CommandLoader(goldy)
+
+    yield goldy
+
+    commands_cache.pop("ping", None)
+
+def message(content:str, guild_id:str = "123"):
+    return {"content": content, "guild_id": guild_id}
+
+def interaction(name:str, type:int = 2, guild_id:str = "123"):
+    return {"type": type, "data": {"name": name}, "guild_id": guild_id}
+
+
+def test_listeners_registered(goldy:StubGoldy):
+    assert set(goldy.listeners) == {"MESSAGE_CREATE", "INTERACTION_CREATE"}
+
+def test_prefix_command(goldy:StubGoldy):
+    commands_cache["ping"] = stub_command()
+    data = message("!ping")
+
+    goldy.listeners["MESSAGE_CREATE"](data)
+    assert goldy.tasks == [(data, PlatterType.PREFIX_CMD)]
+
+def test_prefix_command_with_args(goldy:StubGoldy):
+    commands_cache["ping"] = stub_command()
+    data = message("!ping owo uwu")
+
+    goldy.listeners["MESSAGE_CREATE"](data)
+    assert goldy.tasks == [(data, PlatterType.PREFIX_CMD)]
+
+def test_not_prefix_commands(goldy:StubGoldy):
+    commands_cache["ping"] = stub_command()
+
+    for content in ["!", "! ", "", "?ping", "ping", "!nope"]:
+        goldy.listeners["MESSAGE_CREATE"](message(content))
+
+    goldy.listeners["MESSAGE_CREATE"](message("!ping", guild_id="456")) # Guild not set up.
+
+    assert goldy.tasks == []
+
+def test_prefix_command_not_loaded(goldy:StubGoldy):
+    commands_cache["ping"] = stub_command(loaded=False)
+
+    goldy.listeners["MESSAGE_CREATE"](message("!ping"))
+    assert goldy.tasks == []
+
+def test_prefix_command_not_allowed(goldy:StubGoldy):
+    commands_cache["ping"] = stub_command(allow_prefix_cmd=False)
+
+    goldy.listeners["MESSAGE_CREATE"](message("!ping"))
+    assert goldy.tasks == []
+
+def test_slash_command(goldy:StubGoldy):
+    commands_cache["ping"] = stub_command()
+    data = interaction("ping")
+
+    goldy.listeners["INTERACTION_CREATE"](data)
+    assert goldy.tasks == [(data, PlatterType.SLASH_CMD)]
+
+def test_not_slash_commands(goldy:StubGoldy):
+    commands_cache["ping"] = stub_command()
+
+    goldy.listeners["INTERACTION_CREATE"](interaction("ping", type=3)) # Component interaction.
+    goldy.listeners["INTERACTION_CREATE"](interaction("nope"))
+    goldy.listeners["INTERACTION_CREATE"](interaction("ping", guild_id="456")) # Guild not set up.
+
+    assert goldy.tasks == []
+
+def test_slash_command_not_loaded_or_allowed(goldy:StubGoldy):
+    commands_cache["ping"] = stub_command(loaded=False)
+    goldy.listeners["INTERACTION_CREATE"](interaction("ping"))
+
+    commands_cache["ping"] = stub_command(allow_slash_cmd=False)
+    goldy.listeners["INTERACTION_CREATE"](interaction("ping"))
+
+    assert goldy.tasks == []
+
+
+def test_invalid_slash_commands_skipped(goldy:StubGoldy):
+    sent = []
+
+    async def bulk_overwrite_guild_application_commands(guild_id, commands, **kwargs):
+        sent.append((guild_id, commands))
+        return [dict(payload, id="1") for payload in commands]
+
+    goldy.http_client = SimpleNamespace(bulk_overwrite_guild_application_commands = bulk_overwrite_guild_application_commands)
+    goldy.nc_authentication = None
+    goldy.application_data = {"id": "0"}
+    goldy.guilds.allowed_guilds = [("123", "uwu_hangout_guild")]
+
+    commands = {
+        "ping": {"name": "ping", "description": "Pong!"},
+        "Ping_Caps": {"name": "Ping_Caps", "description": "Pong!"},
+        "ping_long_desc": {"name": "ping_long_desc", "description": "a" * 101},
+        "ping_too_long_name_" + "a" * 20: {"name": "ping_too_long_name_" + "a" * 20, "description": "Pong!"},
+    }
+
+    for name, payload in commands.items():
+        command = stub_command()
+        command.name = name
+        command.slash_payload = payload
+        commands_cache[name] = command
+
+    try:
+        asyncio.run(CommandLoader(goldy).register_all_slash())
+    finally:
+        for name in commands:
+            commands_cache.pop(name, None)
+
+    assert sent == [("123", [commands["ping"]])]